@@ -14,21 +14,27 @@ Behavior:
 - back: exit immediately (stop audio)
 
 Strict JSON-only stdout; non-blocking stdin; heartbeat <= 250ms
-Audio: generates pattern.wav (8s) and loops it with one background /bin/sh loop.
+Audio: generates pattern.wav (8s) and loops it through one long-running player
+fed raw PCM on stdin (paplay/aplay), or a background /bin/sh loop (pw-play).
+Patterns are deterministic per (noise type, rate), so recent ones are kept and
+reused instead of regenerated on every change.
 """
 
 import errno
 import json
 import os
 import selectors
+import shutil
 import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import wave
-import random
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+
+import numpy as np
 
 
 MODULE_NAME = "noise_generator"
@@ -40,13 +46,16 @@ TICK_S = 0.05
 PATTERN_SECONDS = 8.0
 PULSE_DUTY = 0.90  # higher = denser sweep
 
-SAMPLE_RATE = 44100
-CHANNELS = 2
+# Broadband static gains nothing from 44.1 kHz stereo: write 22.05 kHz mono
+# and let PulseAudio/PipeWire (or ALSA's plug device) resample and upmix.
+SAMPLE_RATE = 22050
+CHANNELS = 1
 SAMPLE_WIDTH = 2  # int16
 AMP = 0.85  # fixed; speaker handles volume
 
 AUDIO_ERR_LOG = "/tmp/blackbox_noise_audio.err"
 TMP_PREFIX = "blackbox_noise_"
+PATTERN_CACHE_MAX = 12  # every type/rate pair, ~350 KB each in /tmp
 
 PULSE_OPTIONS_MS = [150, 200, 250, 300]
 NOISE_TYPES: List[str] = ["white", "pink", "brown"]
@@ -65,100 +74,111 @@ def _safe_err(e: BaseException) -> str:
     return s[:220]
 
 
-def _which(cmd: str) -> Optional[str]:
-    for p in os.environ.get("PATH", "").split(":"):
-        fp = os.path.join(p, cmd)
-        if os.path.isfile(fp) and os.access(fp, os.X_OK):
-            return fp
-    return None
-
+def _gen_white(n: int, rng: np.random.Generator) -> np.ndarray:
+    return rng.uniform(-1.0, 1.0, n).astype(np.float32, copy=False)
 
-def _int16(x: float) -> int:
-    if x < -1.0:
-        x = -1.0
-    elif x > 1.0:
-        x = 1.0
-    return int(x * 32767.0)
 
+def _gen_pink(n: int, rng: np.random.Generator) -> np.ndarray:
+    # Voss-McCartney: row k is redrawn every 2**k samples, at sample indices
+    # 2**k - 1, 3 * 2**k - 1, ... Each row is a step function, so it is
+    # built with np.repeat and summed row by row instead of sample by sample.
+    rows_n = 16
+    rows = _gen_white(rows_n, rng)
+    fresh = _gen_white(n, rng)
+    acc = _gen_white(n, rng)
+    for k in range(rows_n):
+        first = (1 << k) - 1
+        if first >= n:
+            acc += rows[k]
+            continue
+        upd = np.arange(first, n, 1 << (k + 1))
+        vals = np.concatenate((rows[k:k+1], fresh[upd]))
+        runs = np.diff(upd, prepend=0, append=n)
+        acc += np.repeat(vals, runs)
+    acc *= np.float32(1.0 / (rows_n + 1))
+    return acc
+
+
+# Powers of the brown-noise leak, for _gen_brown's block recurrence.
+_BROWN_BLOCK = 2048
+_BROWN_LEAK = 0.999 ** np.arange(_BROWN_BLOCK)
+
+
+def _gen_brown(n: int, rng: np.random.Generator) -> np.ndarray:
+    # Leaky integrator x = 0.999 * (x + 0.02 * w), with the gains folded:
+    # x[j] = a * x[j-1] + b * w[j]. Within a block starting from x0 this
+    # unrolls to x[j] = a**j * (a * x0 + sum_{k<=j} a**-k * b * w[k]), so
+    # each block is one cumsum. Blocks keep a**-k small enough for float64.
+    w = _gen_white(n, rng).astype(np.float64)
+    w *= 0.01998
+    out = np.empty(n, dtype=np.float32)
+    x = 0.0
+    mx = 1e-9
+    for i in range(0, n, _BROWN_BLOCK):
+        blk = w[i:i + _BROWN_BLOCK]
+        pw = _BROWN_LEAK[:len(blk)]
+        blk /= pw
+        np.cumsum(blk, out=blk)
+        blk += 0.999 * x
+        blk *= pw
+        out[i:i + len(blk)] = blk
+        x = float(blk[-1])
+        mx = max(mx, float(blk.max()), -float(blk.min()))  # peak before the float32 cast
+    out *= np.float32(1.0 / mx)
+    return out
 
-def _gen_white(n: int, rng: random.Random) -> List[float]:
-    return [rng.uniform(-1.0, 1.0) for _ in range(n)]
 
+_GENERATORS = {
+    "white": _gen_white,
+    "pink": _gen_pink,
+    "brown": _gen_brown,
+}
 
-def _gen_pink(n: int, rng: random.Random) -> List[float]:
-    rows_n = 16
-    rows = [rng.uniform(-1.0, 1.0) for _ in range(rows_n)]
-    s = sum(rows)
-    out: List[float] = []
-    counter = 0
-    for _ in range(n):
-        counter += 1
-        c = counter
-        row = 0
-        while (c & 1) == 0 and row < rows_n:
-            c >>= 1
-            row += 1
-        if row < rows_n:
-            s -= rows[row]
-            rows[row] = rng.uniform(-1.0, 1.0)
-            s += rows[row]
-        white = rng.uniform(-1.0, 1.0)
-        out.append((s + white) / (rows_n + 1))
-    return out
 
+def _fade_edges(n: int, fade_ms: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Linear fade-in and fade-out gains for one pulse of n samples.
 
-def _gen_brown(n: int, rng: random.Random) -> List[float]:
-    out: List[float] = []
-    x = 0.0
-    for _ in range(n):
-        x += rng.uniform(-1.0, 1.0) * 0.02
-        x *= 0.999
-        out.append(x)
-    mx = max(1e-9, max(abs(v) for v in out))
-    scale = 1.0 / mx
-    return [v * scale for v in out]
-
-
-def _apply_fade(mono: List[float], fade_ms: int) -> List[float]:
-    if not mono:
-        return mono
+    Everything between the two ramps has unity gain, so callers only
+    multiply the edges.
+    """
     fade_n = int(SAMPLE_RATE * (fade_ms / 1000.0))
-    fade_n = max(1, min(fade_n, len(mono) // 3))
-    N = len(mono)
-    out = mono[:]
-    for i in range(N):
-        g = 1.0
-        if i < fade_n:
-            g = i / float(fade_n)
-        elif i >= (N - fade_n):
-            g = (N - 1 - i) / float(fade_n)
-            if g < 0.0:
-                g = 0.0
-        out[i] = out[i] * g
-    return out
-
+    fade_n = max(1, min(fade_n, n // 3))
+    head_n = min(fade_n, n)
+    tail_start = max(head_n, n - fade_n)
+    head = np.arange(head_n, dtype=np.float32) / np.float32(fade_n)
+    idx = np.arange(tail_start, n, dtype=np.float32)
+    tail = np.maximum(np.float32(0.0), (np.float32(n - 1) - idx) / np.float32(fade_n))
+    return head, tail
+
+
+def _write_wav(path: str, mono: np.ndarray, pcm: np.ndarray) -> None:
+    # mono is scaled in place; pcm is the caller's interleaved int16 buffer.
+    mono *= np.float32(AMP)
+    np.clip(mono, -1.0, 1.0, out=mono)
+    mono *= np.float32(32767.0)
+    for ch in range(CHANNELS):
+        pcm[ch::CHANNELS] = mono  # truncates toward zero, like astype()
 
-def _write_wav(path: str, mono: List[float]) -> None:
     with wave.open(path, "wb") as wf:
         wf.setnchannels(CHANNELS)
         wf.setsampwidth(SAMPLE_WIDTH)
         wf.setframerate(SAMPLE_RATE)
-
-        frames = bytearray()
-        for s in mono:
-            v = _int16(s * AMP)
-            b = int(v).to_bytes(2, "little", signed=True)
-            frames += b
-            frames += b
-        wf.writeframes(frames)
+        wf.writeframes(pcm)
 
 
 class AudioLoop:
-    """Loop a WAV forever in one background /bin/sh process; capture stderr."""
+    """
+    Loop a WAV forever; capture stderr.
+
+    paplay and aplay are started once in raw mode and a feeder thread writes
+    the pattern's PCM into their stdin over and over, so the loop has no
+    seam and no per-iteration fork/connect. pw-play has no raw stdin mode
+    here and keeps the /bin/sh relaunch loop.
+    """
 
     def __init__(self) -> None:
         for c in ("paplay", "pw-play", "aplay"):
-            p = _which(c)
+            p = shutil.which(c)
             if p:
                 self.player = c
                 self.player_path = p
@@ -168,6 +188,7 @@ class AudioLoop:
             self.player_path = None
         self.proc: Optional[subprocess.Popen] = None
         self.last_exit_code: Optional[int] = None
+        self._feeder: Optional[threading.Thread] = None
 
     def available(self) -> bool:
         return self.player_path is not None
@@ -190,6 +211,14 @@ class AudioLoop:
                     pass
         if self.proc and self.proc.poll() is not None:
             self.last_exit_code = self.proc.returncode
+        if self._feeder is not None:
+            self._feeder.join(timeout=0.5)  # exits on EPIPE once the player is gone
+            self._feeder = None
+        if self.proc and self.proc.stdin:
+            try:
+                self.proc.stdin.close()
+            except Exception:
+                pass
         self.proc = None
 
     def died(self) -> bool:
@@ -219,6 +248,25 @@ class AudioLoop:
             return f'"{self.player_path}" "{wav_path}"'
         return f'"{self.player_path}" -q "{wav_path}"'
 
+    def _raw_cmd(self, rate: int, channels: int) -> Optional[List[str]]:
+        # s16le PCM on stdin; None if the player can't take it.
+        if self.player == "paplay":
+            return [self.player_path, "--raw", "--format=s16le",
+                    f"--rate={rate}", f"--channels={channels}"]
+        if self.player == "aplay":
+            return [self.player_path, "-q", "-t", "raw", "-f", "S16_LE",
+                    "-r", str(rate), "-c", str(channels)]
+        return None
+
+    @staticmethod
+    def _feed(stdin, pcm: bytes) -> None:
+        # Blocking writes: the pipe paces this thread at the playback rate.
+        try:
+            while True:
+                stdin.write(pcm)
+        except Exception:
+            pass  # player stopped or died
+
     def start_continuous(self, wav_path: str) -> None:
         self.stop()
         self.last_exit_code = None
@@ -231,17 +279,35 @@ class AudioLoop:
         except Exception:
             pass
 
-        play_cmd = self._player_cmd(wav_path)
-        loop_cmd = f'exec 2>>"{AUDIO_ERR_LOG}"; while true; do {play_cmd} 1>/dev/null; done'
-
-        self.proc = subprocess.Popen(
-            ["/bin/sh", "-c", loop_cmd],
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            preexec_fn=os.setsid,
-            close_fds=True,
-        )
+        with wave.open(wav_path, "rb") as wf:
+            raw_cmd = self._raw_cmd(wf.getframerate(), wf.getnchannels())
+            pcm = wf.readframes(wf.getnframes()) if raw_cmd else b""
+
+        if raw_cmd:
+            with open(AUDIO_ERR_LOG, "ab") as err:
+                self.proc = subprocess.Popen(
+                    raw_cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=err,
+                    preexec_fn=os.setsid,
+                    close_fds=True,
+                )
+            self._feeder = threading.Thread(
+                target=self._feed, args=(self.proc.stdin, pcm), name="noise-feed", daemon=True)
+            self._feeder.start()
+        else:
+            play_cmd = self._player_cmd(wav_path)
+            loop_cmd = f'exec 2>>"{AUDIO_ERR_LOG}"; while true; do {play_cmd} 1>/dev/null; done'
+
+            self.proc = subprocess.Popen(
+                ["/bin/sh", "-c", loop_cmd],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                preexec_fn=os.setsid,
+                close_fds=True,
+            )
 
         time.sleep(0.05)
         if self.proc.poll() is not None:
@@ -280,7 +346,10 @@ class NoiseModule:
         self._last_state_emit = 0.0
 
         self._tmpdir = tempfile.gettempdir()
-        self._pattern_path = os.path.join(self._tmpdir, f"{TMP_PREFIX}{os.getpid()}_pattern.wav")
+        # (noise_type, pulse_ms) -> pattern WAV on disk, least recently used first
+        self._pattern_cache: Dict[Tuple[str, int], str] = {}
+
+        self._alloc_buffers()
 
     def hello(self) -> None:
         _emit({"type": "hello", "module": MODULE_NAME, "version": MODULE_VERSION})
@@ -313,38 +382,75 @@ class NoiseModule:
             "menu_noise_idx": int(self.menu_noise_idx),
         })
 
-    def _write_pattern(self) -> None:
+    def _alloc_buffers(self) -> None:
+        # Pattern length is fixed, so the float and PCM buffers are reused
+        # across every rate/type change instead of reallocated per pattern.
+        total_n = int(SAMPLE_RATE * PATTERN_SECONDS)
+        self._mono = np.zeros(total_n, dtype=np.float32)
+        self._pcm = np.empty(total_n * CHANNELS, dtype="<i2")
+
+    def _write_pattern(self, path: str) -> None:
         total_n = int(SAMPLE_RATE * PATTERN_SECONDS)
         pulse_n = max(1, int(SAMPLE_RATE * (self.pulse_ms / 1000.0)))
         on_n = max(1, int(pulse_n * PULSE_DUTY))
 
-        rng = random.Random(0x515745 + (NOISE_TYPES.index(self.noise_type) * 1337) + (self.pulse_ms * 17))
+        rng = np.random.default_rng(0x515745 + (NOISE_TYPES.index(self.noise_type) * 1337) + (self.pulse_ms * 17))
+
+        # Every full pulse shares one pair of ramps; only a truncated last
+        # pulse needs its own.
+        edges = _fade_edges(on_n, fade_ms=8)
+
+        gen = _GENERATORS.get(self.noise_type, _gen_brown)
 
-        mono = [0.0] * total_n
+        mono = self._mono
+        mono.fill(0.0)
         i = 0
         while i < total_n:
             n = min(on_n, total_n - i)
-            if self.noise_type == "white":
-                seg = _gen_white(n, rng)
-            elif self.noise_type == "pink":
-                seg = _gen_pink(n, rng)
-            else:
-                seg = _gen_brown(n, rng)
+            seg = gen(n, rng)
 
-            seg = [max(-1.0, min(1.0, x * 0.92)) for x in seg]
-            seg = _apply_fade(seg, fade_ms=8)
+            head, tail = edges if n == on_n else _fade_edges(n, fade_ms=8)
+            seg *= np.float32(0.92)
+            np.clip(seg, -1.0, 1.0, out=seg)
 
-            mono[i:i+n] = seg
+            out = mono[i:i+n]
+            out[:] = seg
+            out[:len(head)] *= head
+            if len(tail):
+                out[n - len(tail):] *= tail
             i += pulse_n
-        _write_wav(self._pattern_path, mono)
+        _write_wav(path, mono, self._pcm)
+
+    def _pattern_path(self) -> str:
+        """WAV for the current type and rate, generated only on a cache miss."""
+        key = (self.noise_type, int(self.pulse_ms))
+        path = self._pattern_cache.pop(key, None)
+        if path is None or not os.path.exists(path):
+            path = os.path.join(self._tmpdir, f"{TMP_PREFIX}{os.getpid()}_{key[0]}_{key[1]}.wav")
+            self._write_pattern(path)
+        self._pattern_cache[key] = path
+        while len(self._pattern_cache) > PATTERN_CACHE_MAX:
+            oldest = next(iter(self._pattern_cache))
+            try:
+                os.remove(self._pattern_cache.pop(oldest))
+            except Exception:
+                pass
+        return path
+
+    def remove_patterns(self) -> None:
+        for path in self._pattern_cache.values():
+            try:
+                os.remove(path)
+            except Exception:
+                pass
+        self._pattern_cache.clear()
 
     def _start_audio(self) -> None:
         if self.playing:
             return
         if not self.audio.available():
             raise RuntimeError("Audio backend not available (need paplay/pw-play/aplay)")
-        self._write_pattern()
-        self.audio.start_continuous(self._pattern_path)
+        self.audio.start_continuous(self._pattern_path())
         self.playing = True
 
     def _stop_audio(self) -> None:
@@ -544,11 +650,7 @@ def main() -> int:
             mod._stop_audio()
         except Exception:
             pass
-        try:
-            if mod._pattern_path and os.path.exists(mod._pattern_path):
-                os.remove(mod._pattern_path)
-        except Exception:
-            pass
+        mod.remove_patterns()
 
 
 if __name__ == "__main__":
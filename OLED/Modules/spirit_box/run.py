@@ -60,7 +60,6 @@ AUDIO_ERR  = "/tmp/blackbox_spirit_audio.err"
 SNAP_WAV   = "/tmp/blackbox_spirit_snap.wav"
 
 HEARTBEAT_S = 0.25
-TICK_S = 0.02  # <=50ms tick
 
 SWEEP_MS_CHOICES = [150, 200, 250, 300]
 DIR_CHOICES = ["fwd", "rev"]
@@ -79,6 +78,11 @@ CHUNK_FRAMES = 1024
 CHUNK_BYTES = CHUNK_FRAMES * FRAME_BYTES
 
 RING_SECONDS = 5  # keep last N seconds for snapshots
+PLAY_QUEUE_CHUNKS = 8  # ~170ms of capture queued for paplay; oldest dropped
+
+# SCHED_FIFO priority for the capture/playback threads. Needs RLIMIT_RTPRIO
+# >= this (LimitRTPRIO= in the systemd unit); otherwise they stay SCHED_OTHER.
+AUDIO_RT_PRIO = 20
 
 # Tuner sweep defaults (FM band)
 FM_MIN = 87.5
@@ -95,6 +99,14 @@ def _log_err(msg: str) -> None:
         pass
 
 
+def _set_realtime(prio: int = AUDIO_RT_PRIO) -> None:
+    # Linux: pid 0 applies to the calling thread only
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(prio))
+    except Exception as e:
+        _log_err(f"sched_fifo_unavailable: {e!r}")
+
+
 # ---------------- strict JSON stdout ----------------
 def _emit(obj: dict) -> None:
     try:
@@ -129,9 +141,13 @@ class StdinReader:
         except Exception:
             pass
 
-    def read_commands(self, max_bytes: int = 4096) -> List[str]:
+    def read_commands(self, max_bytes: int = 4096, timeout: float = 0.0) -> List[str]:
+        """Wait up to `timeout` for input, then return the complete lines read."""
         out: List[str] = []
-        if not self.sel.select(timeout=0):
+        if not self.sel.get_map():
+            time.sleep(timeout)  # stdin hit EOF; just pace the caller
+            return out
+        if not self.sel.select(timeout=timeout):
             return out
 
         drained = 0
@@ -146,6 +162,8 @@ class StdinReader:
                 break
 
             if not chunk:
+                # EOF: stop watching, or select() would return at once forever
+                self.sel.unregister(self.fd)
                 break
 
             drained += len(chunk)
@@ -185,14 +203,20 @@ class PCMRing:
         with self.lock:
             if want <= 0:
                 return b""
-            out = bytearray()
+            # Collect newest-first, then join once: prepending to a growing
+            # bytearray would re-copy everything gathered so far per block.
+            parts: List[bytes] = []
+            got = 0
             for block in reversed(self.q):
-                out[:0] = block  # prepend
-                if len(out) >= want:
+                parts.append(block)
+                got += len(block)
+                if got >= want:
                     break
-            if len(out) > want:
-                out = out[-want:]
-            return bytes(out)
+        parts.reverse()
+        out = b"".join(parts)
+        if len(out) > want:
+            out = out[-want:]
+        return out
 
 
 # ---------------- Pulse playback (PipeWire/PulseAudio) ----------------
@@ -200,12 +224,24 @@ class PulsePlayback:
     """
     Plays raw PCM to the default Pulse sink (PipeWire's PulseAudio server).
     Your system default sink is BT (bluez_output...), so this becomes BT playback automatically.
+
+    Chunks are handed to a writer thread through a small bounded queue, so a
+    stalled paplay/BT sink never blocks the capture thread.
     """
     def __init__(self):
         self.proc: Optional[subprocess.Popen] = None
         self.ok = False
         self._last_start = 0.0
 
+        self.q: Deque[bytes] = deque(maxlen=PLAY_QUEUE_CHUNKS)
+        self.ev = threading.Event()
+        self.t: Optional[threading.Thread] = None
+
+        # Raw stdin fd of paplay; the lock keeps stop() from closing it while
+        # the writer thread is mid-write (fd numbers get reused).
+        self.fd: Optional[int] = None
+        self.fd_lock = threading.Lock()
+
     def start(self) -> None:
         # simple backoff to avoid tight restart loops if BT is missing
         now = time.monotonic()
@@ -235,27 +271,39 @@ class PulsePlayback:
                 bufsize=0,
                 close_fds=True,
             )
+            with self.fd_lock:
+                self.fd = self.proc.stdin.fileno() if self.proc.stdin else None
             self.ok = True
         except Exception as e:
             _log_err(f"paplay_start_failed: {e!r}")
             self.proc = None
             self.ok = False
+            return
+
+        if not self.t:
+            self.t = threading.Thread(target=self._writer, daemon=True)
+            self.t.start()
 
     def stop(self) -> None:
         p = self.proc
         self.proc = None
         self.ok = False
+        self.q.clear()
         if not p:
             return
         try:
+            # terminate first so a writer blocked on a full pipe gets EPIPE
+            # and releases fd_lock
             if p.poll() is None:
                 try:
-                    if p.stdin:
-                        p.stdin.close()
+                    p.terminate()
                 except Exception:
                     pass
+            with self.fd_lock:
+                self.fd = None
                 try:
-                    p.terminate()
+                    if p.stdin:
+                        p.stdin.close()
                 except Exception:
                     pass
         except Exception:
@@ -263,17 +311,37 @@ class PulsePlayback:
 
     def write(self, data: bytes) -> None:
         p = self.proc
-        if not p or p.poll() is not None:
+        if not p or p.poll() is not None or self.fd is None:
             self.ok = False
             return
-        try:
-            if not p.stdin:
-                self.ok = False
-                return
-            p.stdin.write(data)
-            # no need to flush every chunk; pipe is unbuffered-ish with bufsize=0
-        except Exception:
-            self.ok = False
+        # deque(maxlen) drops the oldest chunk if the writer has fallen behind
+        self.q.append(data)
+        self.ev.set()
+
+    def _writer(self) -> None:
+        _set_realtime()
+        while True:
+            self.ev.wait()
+            self.ev.clear()
+            while self.q:
+                try:
+                    data = self.q.popleft()
+                except IndexError:
+                    break
+                with self.fd_lock:
+                    fd = self.fd
+                    if fd is None:
+                        self.q.clear()
+                        break
+                    try:
+                        # straight to the pipe: no file object, no flush
+                        view = memoryview(data)
+                        while view:
+                            view = view[os.write(fd, view):]
+                    except OSError:  # BrokenPipeError when paplay/BT goes away
+                        self.ok = False
+                        self.q.clear()
+                        break
 
 
 # ---------------- ALSA capture (arecord raw) ----------------
@@ -348,8 +416,8 @@ class ALSACapture:
                     p.terminate()
                 except Exception:
                     pass
-                t0 = time.time()
-                while time.time() - t0 < 0.20:
+                t0 = time.monotonic()
+                while time.monotonic() - t0 < 0.20:
                     if p.poll() is not None:
                         break
                     time.sleep(0.01)
@@ -364,6 +432,7 @@ class ALSACapture:
     def _loop(self) -> None:
         # keep capturing; restart arecord up to 3 times if it dies
         self._restart_tries = 0
+        _set_realtime()
 
         while not self.stop_ev.is_set():
             if not self.proc:
@@ -538,7 +607,7 @@ class UIState:
     # internal
     _last_toast_t: float = 0.0
     _fatal_active: bool = False
-    _last_step_t: float = 0.0
+    _next_step_t: float = 0.0  # monotonic deadline of the next sweep step
 
 
 def _emit_page(st: UIState) -> None:
@@ -653,14 +722,13 @@ def main() -> int:
             pass
 
     last_hb = 0.0
-    last_tick = time.monotonic()
+    wait = 0.0
 
     try:
         while not exiting["flag"]:
+            # ---------- process stdin (blocks until input or next deadline) ----------
+            cmds = reader.read_commands(timeout=wait)
             now = time.monotonic()
-
-            # ---------- process stdin (never blocking) ----------
-            cmds = reader.read_commands()
             for cmd in cmds:
                 if cmd == "back":
                     exiting["flag"] = True
@@ -708,7 +776,7 @@ def main() -> int:
                             _toast_throttle(st, "STOP")
                         else:
                             st.playing = True
-                            st._last_step_t = 0.0
+                            st._next_step_t = 0.0
                             _emit_state(st)
                             start_real()
 
@@ -737,8 +805,14 @@ def main() -> int:
                 st.level = int(cap.level)
                 st.alsa_ok = bool(cap.alsa_ok)
 
-                if (now - st._last_step_t) >= (st.sweep_ms / 1000.0):
-                    st._last_step_t = now
+                if now >= st._next_step_t:
+                    # Fixed-rate deadline: loop/tune time doesn't stretch the
+                    # sweep period. After a stall, restart from now instead of
+                    # bursting through the missed steps.
+                    period = st.sweep_ms / 1000.0
+                    st._next_step_t += period
+                    if st._next_step_t <= now:
+                        st._next_step_t = now + period
                     st.freq_mhz = _step_freq(st.freq_mhz, st.direction)
                     try:
                         tuner.set_freq_mhz(st.freq_mhz)
@@ -760,11 +834,11 @@ def main() -> int:
                 _emit_state(st)
                 last_hb = now
 
-            # ---------- tick pacing ----------
-            elapsed = now - last_tick
-            last_tick = now
-            if elapsed < TICK_S:
-                time.sleep(TICK_S - elapsed)
+            # ---------- sleep until input, the next sweep step or heartbeat ----------
+            next_due = last_hb + HEARTBEAT_S
+            if st.playing:
+                next_due = min(next_due, st._next_step_t)
+            wait = max(0.0, next_due - time.monotonic())
 
     finally:
         try:
@@ -30,6 +30,8 @@ import subprocess
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
 
+import numpy as np
+
 
 MODULE_NAME = "tone_generator"
 MODULE_VERSION = "tg_v8_prebaked_shepard"
@@ -171,6 +173,8 @@ class StdinReader:
             except Exception:
                 continue
             if not chunk:
+                # EOF: stop watching, or select() would return at once forever
+                self.sel.unregister(self.fd)
                 continue
             self.buf += chunk
 
@@ -183,32 +187,14 @@ class StdinReader:
 
 
 # ---------------- WAV writer (standard sine only) ----------------
-def _write_wav_from_samples(path: str, samples_iter, seconds: float, rate: int) -> None:
-    total_frames = int(rate * seconds)
+def _write_wav_from_samples(path: str, samples: np.ndarray, rate: int) -> None:
     tmp_path = path + ".tmp"
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2")
     with wave.open(tmp_path, "wb") as wf:
         wf.setnchannels(CHANNELS)
         wf.setsampwidth(SAMPWIDTH)
         wf.setframerate(rate)
-
-        block = bytearray()
-        block_target_frames = 2048
-        i = 0
-
-        for s in samples_iter:
-            v = int(max(-1.0, min(1.0, s)) * 32767)
-            block += int(v).to_bytes(2, byteorder="little", signed=True)
-            i += 1
-
-            if len(block) >= block_target_frames * 2:
-                wf.writeframes(block)
-                block.clear()
-
-            if i >= total_frames:
-                break
-
-        if block:
-            wf.writeframes(block)
+        wf.writeframes(pcm.tobytes())
 
     os.replace(tmp_path, path)
 
@@ -216,16 +202,13 @@ def _write_wav_from_samples(path: str, samples_iter, seconds: float, rate: int)
 def _gen_standard_sine(path: str, freq_hz: int) -> None:
     freq_hz = _clamp(int(freq_hz), 20, 20000)
     amp = 0.90
-    phase = 0.0
     inc = float(freq_hz) / float(RATE_STD)
+    total_frames = int(RATE_STD * DUR_STD)
 
-    def it():
-        nonlocal phase
-        while True:
-            phase += inc
-            yield math.sin(2.0 * math.pi * (phase % 1.0)) * amp
+    phase = np.arange(1, total_frames + 1, dtype=np.float64) * inc
+    samples = np.sin(2.0 * math.pi * (phase % 1.0)) * amp
 
-    _write_wav_from_samples(path, it(), DUR_STD, RATE_STD)
+    _write_wav_from_samples(path, samples, RATE_STD)
 
 
 # ---------------- player loop (immediate stop) ----------------
@@ -273,8 +256,8 @@ def _stop_proc(p: Optional[subprocess.Popen]) -> None:
                 except Exception:
                     pass
             # short wait, then KILL if needed
-            t0 = time.time()
-            while time.time() - t0 < 0.20:
+            t0 = time.monotonic()
+            while time.monotonic() - t0 < 0.20:
                 if p.poll() is not None:
                     break
                 time.sleep(0.01)
@@ -408,6 +391,17 @@ def main() -> int:
 
     audio_proc: Optional[subprocess.Popen] = None
     last_hb = 0.0
+    std_wav_hz: Optional[int] = None  # freq STD_WAV was last rendered at
+
+    def build_std_wav() -> None:
+        # Volume is applied by the player, so the WAV only depends on the
+        # frequency: re-render it only when that changed (or the file is gone).
+        nonlocal std_wav_hz
+        if std_wav_hz == st.freq_hz and os.path.exists(STD_WAV):
+            return
+        std_wav_hz = None
+        _gen_standard_sine(STD_WAV, st.freq_hz)
+        std_wav_hz = st.freq_hz
 
     def stop_audio():
         nonlocal audio_proc
@@ -431,7 +425,7 @@ def main() -> int:
         # For standard tone we (re)generate quickly
         if st.selection != "special_tone":
             try:
-                _gen_standard_sine(STD_WAV, st.freq_hz)
+                build_std_wav()
             except Exception as e:
                 _log_err(f"Std tone build failed: {e!r}")
                 st.playing = False
@@ -443,7 +437,7 @@ def main() -> int:
             # Non-shepard specials currently fall back to std wav (you can add their own assets later)
             if wav == STD_WAV:
                 try:
-                    _gen_standard_sine(STD_WAV, st.freq_hz)
+                    build_std_wav()
                 except Exception as e:
                     _log_err(f"Fallback tone build failed: {e!r}")
                     st.playing = False
@@ -609,9 +603,10 @@ def main() -> int:
 
     # ---------- loop ----------
     while True:
-        now = time.monotonic()
-
-        for cmd in reader.poll_lines(timeout=0.0):
+        # Block in select() until a command arrives or the next heartbeat is
+        # due (fixed deadline, so the heartbeat rate doesn't drift).
+        wait = max(0.0, last_hb + HEARTBEAT_S - time.monotonic())
+        for cmd in reader.poll_lines(timeout=wait):
             if st.page == "main":
                 handle_main(cmd)
             elif st.page == "freq_menu":
@@ -634,6 +629,7 @@ def main() -> int:
             stop_audio()
 
         # Heartbeat
+        now = time.monotonic()
         if now - last_hb >= HEARTBEAT_S:
             last_hb = now
             _emit_state(st)
@@ -643,8 +639,6 @@ def main() -> int:
             _emit({"type": "exit"})
             return 0
 
-        time.sleep(0.01)
-
 
 if __name__ == "__main__":
     try:
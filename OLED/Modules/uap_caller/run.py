@@ -93,7 +93,7 @@ def is_playing() -> bool:
 def playback_elapsed() -> int:
     if started_at is None:
         return 0
-    return int(time.time() - started_at)
+    return int(time.monotonic() - started_at)
 
 
 def stop_playback() -> None:
@@ -137,7 +137,7 @@ def start_playback_loop(path: Path) -> None:
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
-        started_at = time.time()
+        started_at = time.monotonic()
 
     except Exception as e:
         play_proc = None
@@ -149,20 +149,43 @@ def start_playback_loop(path: Path) -> None:
 # -----------------------------
 # Cache/meta
 # -----------------------------
+# 44-byte RIFF/WAVE header (as written by the wave module) + PCM data
+EXPECTED_WAV_BYTES = 44 + int(DURATION_S * SAMPLE_RATE) * CHANNELS * SAMPWIDTH_BYTES
+
+# (stat key of wav + meta, answer): the heartbeat asks 4x/s, the files
+# change only when a build finishes.
+_ready_cache: Optional[tuple] = None
+
+
 def signature_is_ready() -> bool:
-    if not OUT_WAV.exists() or not META_JSON.exists():
-        return False
+    global _ready_cache
     try:
-        meta = json.loads(META_JSON.read_text())
-        return (
-            meta.get("version") == SIGNATURE_VERSION
-            and int(meta.get("sample_rate", -1)) == SAMPLE_RATE
-            and int(meta.get("duration_s", -1)) == DURATION_S
-            and int(meta.get("channels", -1)) == CHANNELS
-        )
-    except Exception:
+        ws = OUT_WAV.stat()
+        ms = META_JSON.stat()
+    except OSError:
         return False
 
+    key = (ws.st_mtime_ns, ws.st_size, ms.st_mtime_ns, ms.st_size)
+    cached = _ready_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    ready = False
+    # A wrong size means a truncated or foreign file (e.g. power cut mid-copy)
+    if ws.st_size == EXPECTED_WAV_BYTES:
+        try:
+            meta = json.loads(META_JSON.read_bytes())
+            ready = (
+                meta.get("version") == SIGNATURE_VERSION
+                and int(meta.get("sample_rate", -1)) == SAMPLE_RATE
+                and int(meta.get("duration_s", -1)) == DURATION_S
+                and int(meta.get("channels", -1)) == CHANNELS
+            )
+        except Exception:
+            ready = False
+    _ready_cache = (key, ready)
+    return ready
+
 
 def write_meta() -> None:
     META_JSON.write_text(
@@ -215,8 +238,8 @@ dur_s = int(sys.argv[3])
 chunk_seconds = float(sys.argv[4])
 
 # Immediate feedback before numpy import
-t0 = time.time()
-emit({"type":"build","pct":0.01,"step":"Loading numpy","elapsed_s":int(time.time()-t0)})
+t0 = time.monotonic()
+emit({"type":"build","pct":0.01,"step":"Loading numpy","elapsed_s":int(time.monotonic()-t0)})
 
 import numpy as np
 
@@ -271,7 +294,7 @@ steps = [
     "Normalizing output",
 ]
 
-emit({"type":"build","pct":0.02,"step":"Starting build","elapsed_s":int(time.time()-t0)})
+emit({"type":"build","pct":0.02,"step":"Starting build","elapsed_s":int(time.monotonic()-t0)})
 
 out_tmp.parent.mkdir(parents=True, exist_ok=True)
 try:
@@ -284,6 +307,9 @@ with wave.open(str(out_tmp), "wb") as wf:
     wf.setnchannels(CHANNELS)
     wf.setsampwidth(SAMPWIDTH_BYTES)
     wf.setframerate(sr)
+    # Final length is known up front: the header is written once with it, and
+    # writeframesraw() skips the per-chunk seek+rewrite of the size fields.
+    wf.setnframes(total_samples)
 
     total_parts = chunks + (1 if remainder else 0)
 
@@ -293,7 +319,7 @@ with wave.open(str(out_tmp), "wb") as wf:
         t_start = chunk_start / sr
 
         step = steps[min(len(steps)-1, (c * len(steps)) // max(1, total_parts))]
-        emit({"type":"build","pct":chunk_start/float(total_samples),"step":step,"elapsed_s":int(time.time()-t0)})
+        emit({"type":"build","pct":chunk_start/float(total_samples),"step":step,"elapsed_s":int(time.monotonic()-t0)})
 
         t = (np.arange(cur_size, dtype=np.float64) / sr) + t_start
 
@@ -352,19 +378,17 @@ with wave.open(str(out_tmp), "wb") as wf:
             mixed = mixed * (0.95/max_amp)
 
         pcm = (mixed*32767.0).astype("int16", copy=False)
-        wf.writeframes(pcm.tobytes())
+        wf.writeframesraw(pcm.tobytes())
 
         done = chunk_start + cur_size
-        emit({"type":"build","pct":done/float(total_samples),"step":step,"elapsed_s":int(time.time()-t0)})
+        emit({"type":"build","pct":done/float(total_samples),"step":step,"elapsed_s":int(time.monotonic()-t0)})
 
-        if (c % 2) == 0:
-            time.sleep(0.001)
-
-emit({"type":"build","pct":1.0,"step":"Build complete","elapsed_s":int(time.time()-t0)})
+emit({"type":"build","pct":1.0,"step":"Build complete","elapsed_s":int(time.monotonic()-t0)})
 """
 
 def _spawn_builder() -> subprocess.Popen:
-    # Spawn with -u so builder progress is flushed immediately
+    # Spawn with -u so builder progress is flushed immediately; stdout is
+    # read raw and non-blocking by the main loop.
     cmd = [
         sys.executable, "-u", "-c", BUILDER_CODE,
         str(OUT_TMP), str(SAMPLE_RATE), str(DURATION_S), str(CHUNK_SECONDS)
@@ -374,8 +398,7 @@ def _spawn_builder() -> subprocess.Popen:
         stdin=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
         stderr=subprocess.DEVNULL,
-        text=True,
-        bufsize=1,
+        bufsize=0,
     )
 
 
@@ -498,19 +521,34 @@ def main() -> int:
     sel.register(stdin_fd, selectors.EVENT_READ, data="stdin")
     stdin_buf = bytearray()
 
+    # builder stdout nonblocking (raw fd, split into lines here)
+    builder_fd: Optional[int] = None
+    builder_buf = bytearray()
+
+    def _unwatch_builder() -> None:
+        nonlocal builder_fd
+        if builder_fd is None:
+            return
+        try:
+            sel.unregister(builder_fd)
+        except Exception:
+            pass
+        builder_fd = None
+
     while not stop_now.is_set():
         # also watch builder stdout if running
-        if _builder_proc and _builder_proc.stdout:
-            try:
-                sel.register(_builder_proc.stdout, selectors.EVENT_READ, data="builder")
-            except KeyError:
-                pass  # already registered
+        if builder_fd is None and _builder_proc and _builder_proc.stdout:
+            builder_fd = _builder_proc.stdout.fileno()
+            builder_buf = bytearray()
+            os.set_blocking(builder_fd, False)
+            sel.register(builder_fd, selectors.EVENT_READ, data="builder")
 
         events = sel.select(timeout=0.1)
 
         # handle builder completion
         if _builder_proc and _builder_proc.poll() is not None:
             rc = _builder_proc.returncode
+            _unwatch_builder()
             _stop_builder()
             if rc == 0 and OUT_TMP.exists():
                 try:
@@ -551,24 +589,38 @@ def main() -> int:
                     handle_cmd(line.decode("utf-8", errors="ignore"))
 
             elif tag == "builder":
-                # read lines without blocking
+                if builder_fd is None:
+                    continue  # builder finished earlier this tick
                 try:
-                    line = key.fileobj.readline()
-                except Exception:
+                    chunk = os.read(builder_fd, 4096)
+                except BlockingIOError:
                     continue
-                if not line:
+                except OSError:
+                    _unwatch_builder()
                     continue
-                line = line.strip()
-                if not line:
+
+                if not chunk:
+                    _unwatch_builder()
                     continue
-                # builder guarantees JSON; but be defensive
-                try:
-                    msg = json.loads(line)
-                except Exception:
+
+                builder_buf.extend(chunk)
+                if b"\n" not in chunk:
                     continue
-                # forward build messages
-                if msg.get("type") == "build":
-                    emit(msg)
+                lines = builder_buf.split(b"\n")
+                builder_buf = lines.pop()
+
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    # builder guarantees JSON; but be defensive
+                    try:
+                        msg = json.loads(line)
+                    except Exception:
+                        continue
+                    # forward build messages
+                    if msg.get("type") == "build":
+                        emit(msg)
 
     _hard_exit(0)
 
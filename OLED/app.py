@@ -6,19 +6,28 @@ import sys
 import time
 import math
 import json
+import fcntl
+import socket
+import struct
+import select
 import selectors
 import subprocess
 import signal
 import errno
-from dataclasses import dataclass
+import queue
+import functools
+import contextlib
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Deque
 
+import numpy as np
+from PIL import Image, ImageDraw
 from gpiozero import Button
 from luma.core.interface.serial import i2c
 from luma.oled.device import ssd1306
-from luma.core.render import canvas
 
 
 # =====================================================
@@ -74,10 +83,17 @@ BACK_POWEROFF_HOLD = 5.0
 
 SPLASH_MIN_SECONDS = 5.0
 SPLASH_FRAME_SLEEP = 0.08
+SPLASH_STATUS_SECONDS = 1.0  # NET/BT re-check interval while the splash animates
 
 # Menu refresh watchdog (helps recover from rare "blank menu" states)
 MENU_REFRESH_SECONDS = 2.0
 
+# WiFi/BT status icons are probed (iw, bluetoothctl) on a background thread
+STATUS_POLL_SECONDS = 2.0
+
+# Launcher side of module logs is block buffered (one write per 64 KB, not per line)
+LOG_BUFFER_BYTES = 64 * 1024
+
 # Branding
 PRODUCT_NAME = "BLACKBOX"
 PRODUCT_SUBTITLE = "PARANORMAL AUDIO"
@@ -90,30 +106,192 @@ VERSION = "v0.9"
 # =====================================================
 _serial = None
 device = None
+_oled_lock = threading.RLock()  # device replacement and I2C writes
+_last_menu_key: Optional[tuple] = None
+_last_frame: Optional[bytes] = None  # last frame handed to the writer
+
+
+class PagedSSD1306(ssd1306):
+    """
+    ssd1306 that only sends the 8-pixel pages that changed since the last
+    frame. Most redraws touch one or two text rows, so this cuts the I2C
+    traffic per frame from 1 KB to a few hundred bytes. The dirty pages are
+    sent as one contiguous span: one address command, one data write.
+
+    The 1-bit image is packed into SSD1306 page bytes with numpy (8 rows
+    per page, LSB = top row) instead of luma's per-pixel Python loop.
+    """
+    def __init__(self, *args, **kwargs):
+        self._last_pages: Optional[List[bytes]] = None
+        super().__init__(*args, **kwargs)
+
+    def resync(self) -> None:
+        """Forget what the panel shows; the next frame is sent in full."""
+        self._last_pages = None
+
+    def display(self, image):
+        assert image.mode == self.mode
+        assert image.size == self.size
+
+        image = self.preprocess(image)
+
+        w = self._w
+        px = np.asarray(image, dtype=np.uint8).reshape(self._pages, 8, w)
+        buf = np.packbits(px, axis=1, bitorder="little").tobytes()
+
+        pages = [buf[p * w:(p + 1) * w] for p in range(self._pages)]
+        last = self._last_pages
+        if last is None:
+            dirty = list(range(self._pages))
+        else:
+            dirty = [p for p in range(self._pages) if pages[p] != last[p]]
+        if not dirty:
+            return
+
+        first, end = dirty[0], dirty[-1] + 1
+        self._last_pages = None  # unknown panel state if the write fails
+        self.command(
+            self._const.COLUMNADDR, self._colstart, self._colend - 1,
+            self._const.PAGEADDR, first, end - 1)
+        self.data(list(buf[first * w:end * w]))
+        self._last_pages = pages
 
 
 def oled_init() -> None:
-    global _serial, device
+    global _serial, device, _last_menu_key, _last_frame
     _serial = i2c(port=I2C_PORT, address=I2C_ADDR)
-    device = ssd1306(_serial, width=OLED_W, height=OLED_H)
+    device = PagedSSD1306(_serial, width=OLED_W, height=OLED_H)
+    _last_menu_key = None
+    _last_frame = None
 
 
 def oled_hard_wake() -> None:
-    global device
-    try:
-        oled_init()
-    except Exception:
-        time.sleep(0.05)
-        oled_init()
+    """
+    Get the panel showing our frames again, e.g. after a module ran. A
+    module may have switched it off or drawn on it itself, so turn it on and
+    resend the next frame in full. Only if that I2C write fails is the bus
+    and controller re-initialised (new i2c + full SSD1306 init sequence).
+    """
+    global device, _last_menu_key, _last_frame
+    with _oled_lock:
+        if device is not None:
+            try:
+                device.show()  # DISPLAYON
+                device.resync()
+                _last_menu_key = None
+                _last_frame = None
+                return
+            except Exception:
+                pass
+        try:
+            oled_init()
+        except Exception:
+            time.sleep(0.05)
+            oled_init()
+
+
+def oled_repaint() -> None:
+    """
+    Send the next frame in full even if it matches the last one, for when
+    the panel may have lost its contents without us knowing (brown-out,
+    bus glitch).
+    """
+    global _last_frame
+    with _oled_lock:
+        if device is not None:
+            device.resync()
+    _last_frame = None
 
 
 def oled_guard() -> None:
+    # The panel is brought up lazily on the first draw, not at import.
     global device
     if device is None:
         oled_hard_wake()
 
 
-oled_init()
+# One frame buffer reused by every screen, instead of the new Image +
+# ImageDraw that luma's canvas() allocates per frame.
+_frame_img = Image.new("1", (OLED_W, OLED_H))
+_frame_draw = ImageDraw.Draw(_frame_img)
+
+
+@contextlib.contextmanager
+def oled_frame(background: Optional[Image.Image] = None):
+    """
+    Drop-in for luma's canvas(device): yields a draw handle on the shared
+    frame (cleared, or a copy of `background`) and hands a copy to the
+    writer thread on exit. As with canvas(), nothing is sent if the block
+    raises, or if the frame is identical to the last one sent.
+    """
+    global _last_frame
+    if background is None:
+        _frame_draw.rectangle((0, 0, OLED_W - 1, OLED_H - 1), fill=0)
+    else:
+        _frame_img.paste(background)
+    yield _frame_draw
+    frame = _frame_img.tobytes()
+    if frame == _last_frame:
+        return  # nothing changed: skip the copy, the packing and the wake-up
+    _last_frame = frame
+    _submit_frame(_frame_img.copy())
+
+
+# Frames are written to the panel by one writer thread, so the UI never
+# waits on I2C. There is a single slot and the newest frame wins: frames
+# submitted while a write is in flight replace each other, and only the
+# last one is sent.
+_frame_cv = threading.Condition()
+_frame_pending: Optional[Image.Image] = None
+_frame_busy = False
+_frame_thread: Optional[threading.Thread] = None
+
+
+def _submit_frame(img: Image.Image) -> None:
+    global _frame_pending, _frame_thread
+    with _frame_cv:
+        _frame_pending = img
+        if _frame_thread is None:
+            _frame_thread = threading.Thread(target=_frame_writer, name="oled", daemon=True)
+            _frame_thread.start()
+        _frame_cv.notify_all()
+
+
+def _frame_writer() -> None:
+    global _frame_pending, _frame_busy, _last_frame
+    while True:
+        with _frame_cv:
+            while _frame_pending is None:
+                _frame_cv.wait()
+            img, _frame_pending = _frame_pending, None
+            _frame_busy = True
+        try:
+            with _oled_lock:
+                try:
+                    device.display(img)
+                except Exception:
+                    # Bus glitch: re-init once and resend; drop the frame if
+                    # that fails too, the next one will try again.
+                    try:
+                        oled_init()
+                        device.display(img)
+                    except Exception:
+                        _last_frame = None
+        finally:
+            with _frame_cv:
+                _frame_busy = False
+                _frame_cv.notify_all()
+
+
+def oled_flush(timeout: float = 1.0) -> None:
+    """Wait until the last submitted frame has been written to the panel."""
+    end = time.monotonic() + timeout
+    with _frame_cv:
+        while _frame_pending is not None or _frame_busy:
+            left = end - time.monotonic()
+            if left <= 0:
+                return
+            _frame_cv.wait(left)
 
 
 # =====================================================
@@ -134,12 +312,24 @@ def sd_write_check() -> Optional[str]:
         return str(e)
 
 
+SIOCGIFADDR = 0x8915
+
+
 def get_ip() -> str:
+    # Same answer as `hostname -I` (first non link-local IPv4), but read with
+    # an ioctl per interface instead of a fork+exec; splash polls this.
     try:
-        ips = subprocess.check_output(["hostname", "-I"], text=True).split()
-        for ip in ips:
-            if ip.count(".") == 3 and not ip.startswith("169.254"):
-                return ip
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            for _, ifname in socket.if_nameindex():
+                if ifname == "lo":
+                    continue
+                try:
+                    req = struct.pack("256s", ifname[:15].encode())
+                    ip = socket.inet_ntoa(fcntl.ioctl(s.fileno(), SIOCGIFADDR, req)[20:24])
+                except OSError:
+                    continue  # interface has no IPv4 address
+                if not ip.startswith(("127.", "169.254")):
+                    return ip
         return ""
     except Exception:
         return ""
@@ -147,14 +337,7 @@ def get_ip() -> str:
 
 def hostname() -> str:
     try:
-        return subprocess.getoutput("hostname").strip()
-    except Exception:
-        return ""
-
-
-def uptime_short() -> str:
-    try:
-        return subprocess.getoutput("uptime -p").replace("up ", "").strip()
+        return socket.gethostname()
     except Exception:
         return ""
 
@@ -166,25 +349,54 @@ def ensure_dirs() -> None:
 
 
 def log_path_for(module_id: str) -> Path:
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ts = time.strftime("%Y%m%d_%H%M%S")
     safe = "".join([c if (c.isalnum() or c in "_-") else "_" for c in module_id])[:40]
     return LOG_DIR / f"{safe}_{ts}.log"
 
 
+def wait_child(proc: subprocess.Popen, timeout: float) -> bool:
+    """
+    Wait up to `timeout` for proc to exit; True if it did. Sleeps on a pidfd
+    so it returns the moment the child exits (Popen.wait(timeout) polls).
+    """
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except Exception:
+        try:
+            proc.wait(timeout=timeout)
+            return True
+        except Exception:
+            return False
+    try:
+        select.select([pidfd], [], [], timeout)
+    finally:
+        os.close(pidfd)
+    return proc.poll() is not None
+
+
 # =====================================================
 # OLED DRAW HELPERS
 # =====================================================
+@functools.lru_cache(maxsize=32)
+def _message_base(title: str, footer: str) -> Image.Image:
+    """Title, divider and footer of an oled_message() frame, rendered once."""
+    img = Image.new("1", (OLED_W, OLED_H))
+    draw = ImageDraw.Draw(img)
+    draw.text((0, 0), title, fill=255)
+    draw.line((0, 12, 127, 12), fill=255)
+    if footer:
+        draw.text((0, 52), footer, fill=255)
+    return img
+
+
 def oled_message(title: str, lines: List[str], footer: str = "") -> None:
     oled_guard()
-    with canvas(device) as draw:
-        draw.text((0, 0), title[:21], fill=255)
-        draw.line((0, 12, 127, 12), fill=255)
+    # The cached base is copied in, so only the body lines are drawn here.
+    with oled_frame(_message_base(title[:21], footer[:21])) as draw:
         y = 16
         for ln in lines[:3]:
             draw.text((0, y), ln[:21], fill=255)
             y += 12
-        if footer:
-            draw.text((0, 52), footer[:21], fill=255)
 
 
 def draw_progress(draw, pct: float) -> None:
@@ -194,29 +406,61 @@ def draw_progress(draw, pct: float) -> None:
     draw.rectangle((x0 + 1, y0 + 1, x0 + 1 + w, y1 - 1), outline=255, fill=255)
 
 
-def draw_waveform(draw, phase: float) -> None:
-    mid = 40
-    amp = 10
-    pts = []
-    for x in range(120):
-        t = (x / 120) * (2 * math.pi)
-        y = math.sin(t * 2 + phase)
-        pts.append((4 + x, int(mid - y * amp)))
+# One full scroll cycle of the splash sine, precomputed at import so each
+# frame just picks a ready-made point list (step ~0.15 rad per frame).
+# The table is built in one numpy pass: rows are frames, columns are x.
+WAVE_FRAMES = 42
+_wave_t = (np.arange(120) / 120) * (2 * math.pi) * 2
+_wave_phase = np.arange(WAVE_FRAMES)[:, None] * (2 * math.pi / WAVE_FRAMES)
+_wave_y = (40 - np.sin(_wave_t + _wave_phase) * 10).astype(np.int32)
+_WAVE_PTS = [list(zip(range(4, 124), row)) for row in _wave_y.tolist()]
+del _wave_t, _wave_phase, _wave_y
+
+
+def draw_waveform(draw, frame: int) -> None:
     draw.rectangle((2, 26, 125, 53), outline=255)
-    draw.line(pts, fill=255)
+    draw.line(_WAVE_PTS[frame % WAVE_FRAMES], fill=255)
 
 
 # =====================================================
 # BUTTONS
 # =====================================================
+# Self-pipe written by every button callback, so idle loops can block in
+# select() on buttons together with other fds (e.g. child stdout).
+_wake_r, _wake_w = os.pipe()
+os.set_blocking(_wake_r, False)
+os.set_blocking(_wake_w, False)
+_wake_sel = selectors.DefaultSelector()
+_wake_sel.register(_wake_r, selectors.EVENT_READ)
+
+
+def _wake_buttons() -> None:
+    try:
+        os.write(_wake_w, b"\0")
+    except OSError:
+        pass  # pipe full: a wake-up is already pending
+
+
+def _drain_wake() -> None:
+    try:
+        while os.read(_wake_r, 64):
+            pass
+    except OSError:
+        pass
+
+
+def wait_for_buttons(timeout: float) -> None:
+    """Sleep until a button callback fires or timeout elapses."""
+    _wake_sel.select(max(0.0, timeout))
+    _drain_wake()
+
+
 def init_buttons():
-    events = {
-        "up": False,
-        "down": False,
-        "select": False,
-        "select_hold": False,
-        "back": False,
-    }
+    # Callbacks run on gpiozero's threads and only put_nowait() names into the
+    # queue; the main thread moves them into `pending`, which keeps press
+    # order and repeats (a second UP before the first is handled is kept).
+    events: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+    pending: Deque[str] = deque(maxlen=16)
 
     btn_up = Button(BTN_UP, pull_up=True, bounce_time=0.06)
     btn_down = Button(BTN_DOWN, pull_up=True, bounce_time=0.06)
@@ -229,36 +473,56 @@ def init_buttons():
     )
     btn_back = Button(BTN_BACK, pull_up=True, bounce_time=0.06)
 
-    btn_up.when_pressed = lambda: events.__setitem__("up", True)
-    btn_down.when_pressed = lambda: events.__setitem__("down", True)
+    def post(k: str) -> None:
+        events.put_nowait(k)
+        _wake_buttons()
+
+    btn_up.when_pressed = lambda: post("up")
+    btn_down.when_pressed = lambda: post("down")
 
-    btn_select.when_pressed = lambda: events.__setitem__("select", True)
-    btn_select.when_held = lambda: events.__setitem__("select_hold", True)
+    btn_select.when_pressed = lambda: post("select")
+    btn_select.when_held = lambda: post("select_hold")
 
-    btn_back.when_pressed = lambda: events.__setitem__("back", True)
+    btn_back.when_pressed = lambda: post("back")
+    btn_back.when_released = _wake_buttons  # ends a BACK hold in main()
+
+    def pull() -> None:
+        while True:
+            try:
+                pending.append(events.get_nowait())
+            except queue.Empty:
+                return
 
     def consume(k: str) -> bool:
-        if events.get(k):
-            events[k] = False
+        # Most calls are misses (no such press queued): test membership on the
+        # short deque rather than raising and catching ValueError each time.
+        pull()
+        if k in pending:
+            pending.remove(k)
             return True
         return False
 
+    def next_event() -> Optional[str]:
+        pull()
+        return pending.popleft() if pending else None
+
     def clear() -> None:
-        for k in events:
-            events[k] = False
+        pull()
+        pending.clear()
 
-    return consume, clear, (btn_up, btn_down, btn_select, btn_back)
+    return consume, clear, next_event, (btn_up, btn_down, btn_select, btn_back)
 
 
 def drain_events(consume, seconds: float = 0.25) -> None:
-    end = time.time() + seconds
-    while time.time() < end:
-        consume("up")
-        consume("down")
-        consume("select")
-        consume("select_hold")
-        consume("back")
-        time.sleep(0.01)
+    end = time.monotonic() + seconds
+    while True:
+        for k in ("up", "down", "select", "select_hold", "back"):
+            while consume(k):
+                pass
+        left = end - time.monotonic()
+        if left <= 0:
+            return
+        wait_for_buttons(left)
 
 
 # =====================================================
@@ -271,23 +535,36 @@ class Module:
     subtitle: str
     entry_path: str
     order: int = 999
+    # Menu row text, unselected and selected, built once (21 chars max)
+    display: str = field(init=False, repr=False)
+    display_sel: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.display = f"  {self.name}"[:21]
+        self.display_sel = f"> {self.name}"[:21]
 
 
 def discover_modules(modules_root: Path) -> List[Module]:
     mods: List[Module] = []
-    if not modules_root.exists():
+    try:
+        # DirEntry.is_dir() answers from the readdir data; no stat per entry
+        with os.scandir(modules_root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
         return mods
 
-    for d in sorted(modules_root.iterdir()):
-        if not d.is_dir():
+    for e in entries:
+        if not e.is_dir():
             continue
+        d = Path(e.path)
 
-        meta_path = d / "module.json"
-        if not meta_path.exists():
+        try:
+            meta_raw = (d / "module.json").read_bytes()
+        except OSError:
             continue
 
         try:
-            meta = json.loads(meta_path.read_text())
+            meta = json.loads(meta_raw)
             if not meta.get("enabled", True):
                 continue
 
@@ -323,7 +600,7 @@ def load_connections() -> dict:
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         if not CONNECTIONS_FILE.exists():
             return {}
-        return json.loads(CONNECTIONS_FILE.read_text())
+        return json.loads(CONNECTIONS_FILE.read_bytes())
     except Exception:
         return {}
 
@@ -345,8 +622,8 @@ def bluetooth_connect(mac: str, timeout: float = 8.0) -> bool:
     if bluetooth_is_connected(mac):
         return True
 
-    start = time.time()
-    while (time.time() - start) < timeout:
+    start = time.monotonic()
+    while (time.monotonic() - start) < timeout:
         try:
             subprocess.run(["bluetoothctl", "connect", mac], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=6)
         except Exception:
@@ -362,8 +639,9 @@ def bluetooth_connect(mac: str, timeout: float = 8.0) -> bool:
 
 _status_bt_mac = ""
 _bt_ok = False
-_last_status_check = 0.0
 _wifi_bars = 0
+_status_kick = threading.Event()
+_status_thread: Optional[threading.Thread] = None
 
 
 def bluetooth_autoconnect_ui() -> bool:
@@ -421,13 +699,8 @@ def wifi_bars_from_rssi(rssi: Optional[int]) -> int:
     return 0
 
 
-def status_refresh(force: bool = False) -> None:
-    global _last_status_check, _wifi_bars, _bt_ok
-
-    now = time.time()
-    if (not force) and (now - _last_status_check) < 2.0:
-        return
-    _last_status_check = now
+def _status_probe() -> None:
+    global _wifi_bars, _bt_ok
 
     rssi = wifi_rssi_dbm("wlan0")
     if rssi is None:
@@ -441,6 +714,28 @@ def status_refresh(force: bool = False) -> None:
         _bt_ok = False
 
 
+def _status_worker() -> None:
+    while True:
+        _status_kick.wait(STATUS_POLL_SECONDS)
+        _status_kick.clear()
+        _status_probe()
+
+
+def status_refresh(force: bool = False) -> None:
+    """
+    Keep _wifi_bars/_bt_ok current without blocking the UI on iw/bluetoothctl.
+    The first call probes inline (so the first menu has real icons) and starts
+    the poller thread; force=True asks the poller for a fresh probe now.
+    """
+    global _status_thread
+    if _status_thread is None:
+        _status_probe()
+        _status_thread = threading.Thread(target=_status_worker, name="status", daemon=True)
+        _status_thread.start()
+    elif force:
+        _status_kick.set()
+
+
 def draw_wifi_bars(draw, x_right: int, y_top: int, bars: int) -> int:
     w = 2
     gap = 1
@@ -481,16 +776,27 @@ def draw_bt_icon(draw, x_right: int, y_top: int, connected: bool) -> int:
 # UI SCREENS
 # =====================================================
 def splash() -> None:
-    start = time.time()
-    phase = 0.0
+    start = time.monotonic()
+    frame = 0
+    ip = ""
+    bt_ok = False
+    next_check = 0.0
 
     while True:
-        ip = get_ip()
+        # bluetoothctl is a fork per call: check the radios once a second,
+        # not on every 80 ms animation frame, and stop once each is up.
+        now = time.monotonic()
+        if now >= next_check:
+            next_check = now + SPLASH_STATUS_SECONDS
+            if not ip:
+                ip = get_ip()
+            if not bt_ok and _status_bt_mac:
+                bt_ok = bluetooth_is_connected(_status_bt_mac)
         net = "NET OK" if ip else "NET..."
-        bt = "BT OK" if (_status_bt_mac and bluetooth_is_connected(_status_bt_mac)) else "BT..."
+        bt = "BT OK" if bt_ok else "BT..."
 
         oled_guard()
-        with canvas(device) as draw:
+        with oled_frame() as draw:
             draw.text((0, 0), PRODUCT_NAME[:21], fill=255)
             draw.text((OLED_W - (len(VERSION) * 6), 0), VERSION, fill=255)
             draw.line((0, 12, 127, 12), fill=255)
@@ -498,11 +804,11 @@ def splash() -> None:
             draw.text((0, 28), TAGLINE[:21], fill=255)
             draw.line((0, 44, 127, 44), fill=255)
             draw.text((0, 48), f"{net}  {bt}"[:21], fill=255)
-            draw_waveform(draw, phase)
+            draw_waveform(draw, frame)
 
-        phase += 0.15
+        frame = (frame + 1) % WAVE_FRAMES
 
-        if (time.time() - start) >= SPLASH_MIN_SECONDS and ip:
+        if (time.monotonic() - start) >= SPLASH_MIN_SECONDS and ip:
             return
 
         time.sleep(SPLASH_FRAME_SLEEP)
@@ -512,15 +818,15 @@ def startup_sequence(consume, clear) -> None:
     clear()
     drain_events(consume, seconds=0.10)
 
-    t0 = time.time()
-    while time.time() - t0 < 0.9:
+    t0 = time.monotonic()
+    while time.monotonic() - t0 < 0.9:
         oled_guard()
-        with canvas(device) as draw:
+        with oled_frame() as draw:
             draw.text((0, 0), PRODUCT_NAME[:21], fill=255)
             draw.text((OLED_W - (len(VERSION) * 6), 0), VERSION, fill=255)
             draw.line((0, 12, 127, 12), fill=255)
             draw.text((0, 18), "INITIALIZING...", fill=255)
-            draw_progress(draw, (time.time() - t0) / 0.9)
+            draw_progress(draw, (time.monotonic() - t0) / 0.9)
         time.sleep(0.05)
 
     sd_err = sd_write_check()
@@ -541,17 +847,17 @@ def startup_sequence(consume, clear) -> None:
     )
     time.sleep(1.2)
 
-    t1 = time.time()
+    t1 = time.monotonic()
     ip = ""
-    while time.time() - t1 < 2.5:
+    while time.monotonic() - t1 < 2.5:
         ip = get_ip()
         oled_guard()
-        with canvas(device) as draw:
+        with oled_frame() as draw:
             draw.text((0, 0), "RADIOS", fill=255)
             draw.line((0, 12, 127, 12), fill=255)
             draw.text((0, 18), f"WIFI {'OK' if ip else '...'}", fill=255)
             draw.text((0, 30), "BT   ...", fill=255)
-            draw_progress(draw, min(1.0, (time.time() - t1) / 2.5))
+            draw_progress(draw, min(1.0, (time.monotonic() - t1) / 2.5))
         if ip:
             break
         time.sleep(0.1)
@@ -573,11 +879,26 @@ def startup_sequence(consume, clear) -> None:
     drain_events(consume, seconds=0.10)
 
 
-def draw_menu(mods: List[Module], idx: int) -> None:
+def draw_menu(mods: List[Module], idx: int, force: bool = False) -> None:
+    """
+    Draw the module menu. Skipped when nothing on it (selection, scroll
+    window, status icons) changed since the last draw, unless force=True
+    (e.g. another screen was shown in between).
+    """
+    global _last_menu_key
     status_refresh(force=False)
 
+    visible_rows = 3
+    start_i = 0
+    if len(mods) > visible_rows:
+        start_i = max(0, min(idx - 1, len(mods) - visible_rows))
+
+    key = (idx, start_i, len(mods), _bt_ok, _wifi_bars)
+    if not force and key == _last_menu_key:
+        return
+
     oled_guard()
-    with canvas(device) as draw:
+    with oled_frame() as draw:
         draw.text((0, 0), f"{PRODUCT_NAME} MENU"[:21], fill=255)
 
         x = OLED_W - 1
@@ -586,19 +907,15 @@ def draw_menu(mods: List[Module], idx: int) -> None:
 
         draw.line((0, 12, 127, 12), fill=255)
 
-        visible_rows = 3
-        start_i = 0
-        if len(mods) > visible_rows:
-            start_i = max(0, min(idx - 1, len(mods) - visible_rows))
-
         for row in range(visible_rows):
             i = start_i + row
             if i >= len(mods):
                 break
-            prefix = ">" if i == idx else " "
-            draw.text((0, 16 + row * 12), f"{prefix} {mods[i].name}"[:21], fill=255)
+            m = mods[i]
+            draw.text((0, 16 + row * 12), m.display_sel if i == idx else m.display, fill=255)
 
         draw.text((0, 52), "SEL=run  HOLD=cfg", fill=255)
+    _last_menu_key = key
 
 
 # =====================================================
@@ -606,9 +923,9 @@ def draw_menu(mods: List[Module], idx: int) -> None:
 # =====================================================
 def confirm_action(label: str, consume, clear) -> bool:
     clear()
-    end = time.time() + 3
+    end = time.monotonic() + 3
     while True:
-        remaining = int(end - time.time()) + 1
+        remaining = int(end - time.monotonic()) + 1
         if remaining <= 0:
             return True
         oled_message(label, [f"Confirm in {remaining}s", "Tap BACK to cancel", ""], "")
@@ -617,16 +934,19 @@ def confirm_action(label: str, consume, clear) -> bool:
             time.sleep(0.5)
             clear()
             return False
-        time.sleep(0.05)
+        # Sleep until BACK or the countdown reaches its next whole second.
+        wait_for_buttons((end - time.monotonic()) % 1.0 + 0.01)
 
 
 def reboot() -> None:
     oled_message("REBOOT", ["Rebooting...", "", ""], "")
+    oled_flush()
     subprocess.Popen(["sudo", "-n", "systemctl", "reboot"])
 
 
 def poweroff() -> None:
     oled_message("POWEROFF", ["Shutting down...", "", ""], "")
+    oled_flush()
     subprocess.Popen(["sudo", "-n", "systemctl", "poweroff"])
 
 
@@ -635,25 +955,26 @@ def poweroff() -> None:
 # =====================================================
 def settings(consume, clear) -> None:
     clear()
+    status_refresh(force=True)
+    last_lines = None
     while True:
-        status_refresh(force=True)
         ip = get_ip() or "none"
-        up = uptime_short() or "unknown"
         host = hostname() or "blackbox"
 
         bt_state = "OK" if _bt_ok else "none"
         wf = f"{_wifi_bars}/3"
 
-        oled_message(
-            f"{PRODUCT_NAME} STATUS",
-            [f"HOST {host}"[:21], f"IP {ip}"[:21], f"WIFI {wf}  BT {bt_state}"[:21]],
-            "BACK = menu",
-        )
+        lines = [f"HOST {host}"[:21], f"IP {ip}"[:21], f"WIFI {wf}  BT {bt_state}"[:21]]
+        if lines != last_lines:
+            oled_message(f"{PRODUCT_NAME} STATUS", lines, "BACK = menu")
+            last_lines = lines
 
         if consume("back"):
             clear()
             return
-        time.sleep(0.15)
+        # Static page: sleep until a button fires, re-reading the status
+        # lines only as often as the status thread updates them.
+        wait_for_buttons(STATUS_POLL_SECONDS)
 
 
 # =====================================================
@@ -666,11 +987,14 @@ class StdoutJSONPump:
       - drains as much as is available per tick
       - splits by newline into JSON lines
       - tolerates partial lines
+      - keeps complete lines beyond max_lines queued for the next tick
     """
     def __init__(self, fileobj, log_fn):
         self.fileobj = fileobj
         self.log = log_fn
         self.buf = bytearray()
+        self.lines: Deque[bytes] = deque()
+        self.eof = False  # child closed stdout; fd stays readable from now on
         self.fd = fileobj.fileno()
         os.set_blocking(self.fd, False)
         self.sel = selectors.DefaultSelector()
@@ -690,15 +1014,7 @@ class StdoutJSONPump:
         except Exception:
             pass
 
-    def pump(self, max_bytes: int = 65536, max_lines: int = 50) -> List[Dict[str, Any]]:
-        """
-        Drain available stdout and return parsed JSON messages (up to max_lines).
-        Never blocks.
-        """
-        msgs: List[Dict[str, Any]] = []
-        if not self.sel.select(timeout=0):
-            return msgs
-
+    def _drain(self, max_bytes: int) -> None:
         drained = 0
         while drained < max_bytes:
             try:
@@ -711,37 +1027,48 @@ class StdoutJSONPump:
                 break
 
             if not chunk:
+                self.eof = True
                 break
 
             drained += len(chunk)
             self.buf.extend(chunk)
 
-            # Process complete lines
-            while b"\n" in self.buf and len(msgs) < max_lines:
-                line, _, rest = self.buf.partition(b"\n")
-                self.buf = bytearray(rest)
+            # Split once per chunk; the trailing partial line stays buffered
+            if b"\n" in chunk:
+                parts = self.buf.split(b"\n")
+                self.buf = parts.pop()
+                self.lines.extend(parts)
 
-                if not line:
-                    continue
-                try:
-                    s = line.decode("utf-8", errors="strict").strip()
-                except Exception:
-                    continue
-                if not s:
-                    continue
+    def pump(self, max_bytes: int = 65536, max_lines: int = 50) -> List[Dict[str, Any]]:
+        """
+        Drain available stdout and return parsed JSON messages (up to max_lines).
+        Never blocks.
+        """
+        msgs: List[Dict[str, Any]] = []
+        if not self.eof and self.sel.select(timeout=0):
+            self._drain(max_bytes)
 
-                # Child must never emit non-JSON; but be defensive.
-                try:
-                    obj = json.loads(s)
-                except Exception:
-                    self.log(f"[child-nonjson] {s}")
-                    continue
+        lines = self.lines
+        while lines and len(msgs) < max_lines:
+            line = lines.popleft()
+            if not line:
+                continue
+            try:
+                s = line.decode("utf-8", errors="strict").strip()
+            except Exception:
+                continue
+            if not s:
+                continue
 
-                self.log(f"[child] {s}")
-                msgs.append(obj)
+            # Child must never emit non-JSON; but be defensive.
+            try:
+                obj = json.loads(s)
+            except Exception:
+                self.log(f"[child-nonjson] {s}")
+                continue
 
-            if len(msgs) >= max_lines:
-                break
+            self.log(f"[child] {s}")
+            msgs.append(obj)
 
         return msgs
 
@@ -749,6 +1076,10 @@ class StdoutJSONPump:
 # =====================================================
 # MODULE RUNNER
 # =====================================================
+# Button commands as the stdin lines the modules read, encoded once.
+CMD_LINES = {c: (c + "\n").encode("ascii") for c in ("up", "down", "select", "select_hold", "back")}
+
+
 def run_module(mod: Module, consume, clear) -> None:
     """
     Runs a module as a child process and forwards button events to it via stdin.
@@ -761,7 +1092,6 @@ def run_module(mod: Module, consume, clear) -> None:
 
     All other modules remain legacy (stdin forwarding only; stdout->log/devnull).
     """
-    ensure_dirs()
 
     # Clear/drain BEFORE launch so stale BACK never gets forwarded.
     clear()
@@ -769,13 +1099,24 @@ def run_module(mod: Module, consume, clear) -> None:
 
     oled_message("RUNNING", [mod.name, mod.subtitle], "BACK = exit")
 
-    cmd = [sys.executable, mod.entry_path]
+    # -u: modules' stdout/stderr reach the log (or the JSON pump) as they are
+    # written, not in 8 KB blocks. stdbuf would not help: Python does its own
+    # buffering, not C stdio's.
+    cmd = [sys.executable, "-u", mod.entry_path]
     log_path = log_path_for(mod.id)
 
-    try:
-        logf = open(log_path, "w", buffering=1)
-    except Exception:
-        logf = None
+    # Append mode: the child writes its stderr straight into the same file,
+    # so both sides must write at the end rather than at their own offsets.
+    # LOG_DIR is created by main(); only re-create it if it vanished.
+    logf = None
+    for _ in range(2):
+        try:
+            logf = open(log_path, "a", buffering=LOG_BUFFER_BYTES)
+            break
+        except FileNotFoundError:
+            ensure_dirs()
+        except Exception:
+            break
 
     def log(line: str) -> None:
         try:
@@ -784,7 +1125,32 @@ def run_module(mod: Module, consume, clear) -> None:
         except Exception:
             pass
 
+    def flush_log() -> None:
+        # One write() per batch of lines. The child's stderr goes straight
+        # into the same file, so what we buffered must land before it does.
+        try:
+            if logf:
+                logf.flush()
+        except Exception:
+            pass
+
+    def close_log() -> None:
+        # The log is write-once: after flushing, tell the kernel its pages
+        # need not stay cached so they don't push out anything useful.
+        if not logf:
+            return
+        try:
+            logf.flush()
+            os.posix_fadvise(logf.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except Exception:
+            pass
+        try:
+            logf.close()
+        except Exception:
+            pass
+
     log(f"[launcher] cmd={cmd!r}")
+    flush_log()  # keep our header ahead of the child's output
 
     is_uap = (mod.id == "uap_caller")
     is_noise = (mod.id == "noise_generator")
@@ -802,42 +1168,64 @@ def run_module(mod: Module, consume, clear) -> None:
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE if is_json_ui else (logf if logf else subprocess.DEVNULL),
             stderr=logf if logf else subprocess.DEVNULL,
-            text=False if is_json_ui else True,
-            bufsize=0 if is_json_ui else 1,
+            bufsize=0,  # raw binary stdin; commands go out via os.writev()
             close_fds=True,
         )
     except Exception as e:
         log(f"[launcher] failed_to_start: {e!r}")
-        if logf:
-            try:
-                logf.close()
-            except Exception:
-                pass
+        close_log()
         oled_message("LAUNCH FAIL", [mod.name, str(e)[:21], ""], "BACK = menu")
         time.sleep(1.2)
         clear()
         oled_hard_wake()
         return
 
+    # Commands queued by send() during one wake-up; flush_sends() hands them
+    # to the child in a single writev() instead of one write() each.
+    # stdin is non-blocking so a child that stops reading can't stall the UI:
+    # whatever the pipe won't take yet stays queued for the next flush.
+    outbox: List[bytes] = []
+    try:
+        os.set_blocking(proc.stdin.fileno(), False)
+    except Exception:
+        pass
+
     def send(cmd_text: str) -> None:
+        line = CMD_LINES.get(cmd_text)
+        outbox.append(line if line is not None else (cmd_text + "\n").encode("utf-8"))
+        if len(outbox) > 64:
+            del outbox[0]  # child isn't reading; don't grow without bound
+
+    def flush_sends() -> None:
+        if not outbox:
+            return
         try:
-            if proc and proc.poll() is None and proc.stdin:
-                proc.stdin.write((cmd_text + "\n").encode("utf-8"))
-                proc.stdin.flush()
+            if not (proc and proc.poll() is None and proc.stdin):
+                outbox.clear()
+                return
+            n = os.writev(proc.stdin.fileno(), outbox)
+        except BlockingIOError:
+            return  # pipe full; retry on the next flush
         except Exception:
-            pass
+            outbox.clear()
+            return
+        while n and outbox:
+            if n >= len(outbox[0]):
+                n -= len(outbox.pop(0))
+            else:
+                outbox[0] = outbox[0][n:]
+                n = 0
 
     def graceful_exit() -> None:
         """Ask child to exit and then terminate if it doesn't."""
         try:
             send("back")
+            flush_sends()
         except Exception:
             pass
         # give it a moment to exit cleanly
-        for _ in range(50):
-            if proc.poll() is not None:
-                return
-            time.sleep(0.02)
+        if wait_child(proc, 1.0):
+            return
         try:
             proc.terminate()
         except Exception:
@@ -847,10 +1235,12 @@ def run_module(mod: Module, consume, clear) -> None:
         """
         Forward buttons with HOLD FIRST ordering.
         Returns True if BACK was pressed (caller can break).
+        Every queued UP/DOWN goes out in this pass, so a fast scroll isn't
+        spread over several wait_io() sleeps.
         """
-        if consume("up"):
+        while consume("up"):
             send("up")
-        if consume("down"):
+        while consume("down"):
             send("down")
 
         if consume("select_hold"):
@@ -858,6 +1248,7 @@ def run_module(mod: Module, consume, clear) -> None:
             consume("select")  # discard any queued short-press from same physical press
         elif consume("select"):
             send("select")
+        flush_sends()
 
         if consume("back"):
             graceful_exit()
@@ -880,13 +1271,42 @@ def run_module(mod: Module, consume, clear) -> None:
                 pass
             time.sleep(1.0)
             oled_hard_wake()
-            if logf:
-                try:
-                    logf.close()
-                except Exception:
-                    pass
+            close_log()
             return
 
+    # Everything the UI loops wait on: buttons, child stdout, child exit.
+    io_sel = selectors.DefaultSelector()
+    io_sel.register(_wake_r, selectors.EVENT_READ)
+    pump_registered = False
+    if pump:
+        io_sel.register(pump.fd, selectors.EVENT_READ)
+        pump_registered = True
+    pidfd = None
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+        io_sel.register(pidfd, selectors.EVENT_READ)
+    except Exception:
+        pidfd = None  # older kernel: exit is still seen via stdout EOF/timeout
+
+    def wait_io(timeout: float) -> None:
+        """Block until a button press, child output/exit, or timeout."""
+        nonlocal pump_registered
+        flush_log()  # lines logged this pass go out before we sleep
+        if pump and pump.lines:
+            return  # lines left over from the last pump() are still queued
+        if pump_registered and pump.eof:
+            # A closed stdout polls readable forever; stop watching it.
+            try:
+                io_sel.unregister(pump.fd)
+            except Exception:
+                pass
+            pump_registered = False
+        try:
+            io_sel.select(max(0.0, timeout))
+        except Exception:
+            time.sleep(0.02)
+        _drain_wake()
+
     try:
         # =====================================================
         # UAP Caller JSON UI path
@@ -901,8 +1321,9 @@ def run_module(mod: Module, consume, clear) -> None:
                 "fatal": "",
             }
 
-            last_msg_time = time.time()
+            last_msg_time = time.monotonic()
             last_draw_time = 0.0
+            last_ui_key = None  # skip redraws when nothing visible changed
 
             def draw_build() -> None:
                 pct = float(state.get("build_pct") or 0.0)
@@ -938,12 +1359,13 @@ def run_module(mod: Module, consume, clear) -> None:
             while proc.poll() is None:
                 msgs = pump.pump(max_bytes=65536, max_lines=80)
                 if msgs:
-                    last_msg_time = time.time()
+                    last_msg_time = time.monotonic()
                     for m in msgs:
                         apply_msg(m)
 
-                now = time.time()
-                if now - last_draw_time >= 0.10:
+                now = time.monotonic()
+                ui_key = tuple(state.values())
+                if now - last_draw_time >= 0.10 and ui_key != last_ui_key:
                     if state.get("page") == "build":
                         draw_build()
                     elif state.get("page") == "fatal":
@@ -951,11 +1373,12 @@ def run_module(mod: Module, consume, clear) -> None:
                     else:
                         draw_playback()
                     last_draw_time = now
+                    last_ui_key = ui_key
 
                 if hold_first_buttons():
                     break
 
-                if (time.time() - last_msg_time) > 20.0:
+                if (time.monotonic() - last_msg_time) > 20.0:
                     log("[launcher] watchdog: uap_caller silent >20s; terminating")
                     try:
                         proc.terminate()
@@ -963,7 +1386,8 @@ def run_module(mod: Module, consume, clear) -> None:
                         pass
                     break
 
-                time.sleep(0.02)
+                # Sleep until input/output arrives, or a throttled redraw is due.
+                wait_io(last_draw_time + 0.10 - now if ui_key != last_ui_key else 0.25)
 
         # =====================================================
         # Noise Generator JSON UI path
@@ -980,8 +1404,9 @@ def run_module(mod: Module, consume, clear) -> None:
                 "fatal": "",
             }
 
-            last_msg_time = time.time()
+            last_msg_time = time.monotonic()
             last_draw_time = 0.0
+            last_ui_key = None  # skip redraws when nothing visible changed
 
             def _noise_disp() -> str:
                 raw = str(state.get("noise_type") or "white").strip().lower()
@@ -1035,7 +1460,7 @@ def run_module(mod: Module, consume, clear) -> None:
                 exit_requested = False
 
                 if msgs:
-                    last_msg_time = time.time()
+                    last_msg_time = time.monotonic()
 
                 for msg in msgs:
                     t = msg.get("type")
@@ -1051,8 +1476,9 @@ def run_module(mod: Module, consume, clear) -> None:
                     elif t == "exit":
                         exit_requested = True
 
-                now = time.time()
-                if (now - last_draw_time) >= 0.08:
+                now = time.monotonic()
+                ui_key = tuple(state.values())
+                if (now - last_draw_time) >= 0.08 and ui_key != last_ui_key:
                     pg = str(state.get("page") or "main")
                     if pg == "fatal":
                         draw_fatal()
@@ -1063,6 +1489,7 @@ def run_module(mod: Module, consume, clear) -> None:
                     else:
                         draw_main()
                     last_draw_time = now
+                    last_ui_key = ui_key
 
                 if exit_requested:
                     break
@@ -1078,7 +1505,8 @@ def run_module(mod: Module, consume, clear) -> None:
                         pass
                     break
 
-                time.sleep(0.02)
+                # Sleep until input/output arrives, or a throttled redraw is due.
+                wait_io(last_draw_time + 0.08 - now if ui_key != last_ui_key else 0.25)
 
         # =====================================================
         # Tone Generator JSON UI path
@@ -1122,8 +1550,9 @@ def run_module(mod: Module, consume, clear) -> None:
                 ("contact_resp", "Contact Response (Original)"),
             ]
 
-            last_msg_time = time.time()
+            last_msg_time = time.monotonic()
             last_draw_time = 0.0
+            last_ui_key = None  # skip redraws when nothing visible changed
 
             def _text_w_px(s: str) -> int:
                 return len(s) * 6
@@ -1146,7 +1575,7 @@ def run_module(mod: Module, consume, clear) -> None:
                 draw.text((10, y), text[:19], fill=255)
 
             def _toast_active() -> str:
-                now = time.time()
+                now = time.monotonic()
                 if state.get("toast") and now < float(state.get("toast_until") or 0.0):
                     return str(state.get("toast") or "")[:21]
                 return ""
@@ -1176,7 +1605,7 @@ def run_module(mod: Module, consume, clear) -> None:
                 toast_text = _toast_active()
 
                 oled_guard()
-                with canvas(device) as draw:
+                with oled_frame() as draw:
                     _draw_header(draw, "Tone Generator", status=_status())
                     y0 = 14
                     row_h = 12
@@ -1195,7 +1624,7 @@ def run_module(mod: Module, consume, clear) -> None:
                 toast_text = _toast_active()
 
                 oled_guard()
-                with canvas(device) as draw:
+                with oled_frame() as draw:
                     _draw_header(draw, "Frequency", status=_status())
                     y0 = 14
                     row_h = 12
@@ -1209,7 +1638,7 @@ def run_module(mod: Module, consume, clear) -> None:
                 toast_text = _toast_active()
 
                 oled_guard()
-                with canvas(device) as draw:
+                with oled_frame() as draw:
                     _draw_header(draw, "Manual Freq", status=_status())
                     draw.text((2, 18), f"{freq} Hz"[:21], fill=255)
                     draw.text((2, 32), "UP/DN change"[:21], fill=255)
@@ -1224,7 +1653,7 @@ def run_module(mod: Module, consume, clear) -> None:
                 toast_text = _toast_active()
 
                 oled_guard()
-                with canvas(device) as draw:
+                with oled_frame() as draw:
                     _draw_header(draw, title, status=_status())
                     y0 = 14
                     row_h = 12
@@ -1253,7 +1682,7 @@ def run_module(mod: Module, consume, clear) -> None:
                 exit_requested = False
 
                 if msgs:
-                    last_msg_time = time.time()
+                    last_msg_time = time.monotonic()
 
                 for msg in msgs:
                     t = msg.get("type")
@@ -1271,17 +1700,18 @@ def run_module(mod: Module, consume, clear) -> None:
                         txt = str(msg.get("message") or "")[:21]
                         if txt:
                             state["toast"] = txt
-                            state["toast_until"] = time.time() + 1.2
+                            state["toast_until"] = time.monotonic() + 1.2
                     elif t == "fatal":
                         state["page"] = "fatal"
                         state["fatal"] = str(msg.get("message", "fatal"))
                         state["toast"] = state["fatal"][:21]
-                        state["toast_until"] = time.time() + 2.0
+                        state["toast_until"] = time.monotonic() + 2.0
                     elif t == "exit":
                         exit_requested = True
 
-                now = time.time()
-                if (now - last_draw_time) >= 0.08:
+                now = time.monotonic()
+                ui_key = (tuple(state.values()), _toast_active())
+                if (now - last_draw_time) >= 0.08 and ui_key != last_ui_key:
                     pg = str(state.get("page") or "main")
                     if pg == "fatal":
                         draw_fatal()
@@ -1296,6 +1726,7 @@ def run_module(mod: Module, consume, clear) -> None:
                     else:
                         draw_main()
                     last_draw_time = now
+                    last_ui_key = ui_key
 
                 if exit_requested:
                     break
@@ -1311,7 +1742,8 @@ def run_module(mod: Module, consume, clear) -> None:
                         pass
                     break
 
-                time.sleep(0.02)
+                # Sleep until input/output arrives, or a throttled redraw is due.
+                wait_io(last_draw_time + 0.08 - now if ui_key != last_ui_key else 0.25)
 
         # =====================================================
         # Spirit Box JSON UI path
@@ -1328,8 +1760,9 @@ def run_module(mod: Module, consume, clear) -> None:
                 "fatal": "",
             }
 
-            last_msg_time = time.time()
+            last_msg_time = time.monotonic()
             last_draw_time = 0.0
+            last_ui_key = None  # skip redraws when nothing visible changed
 
             def _dir_disp() -> str:
                 d = str(state.get("direction") or "fwd").lower()
@@ -1377,7 +1810,7 @@ def run_module(mod: Module, consume, clear) -> None:
                 exit_requested = False
 
                 if msgs:
-                    last_msg_time = time.time()
+                    last_msg_time = time.monotonic()
 
                 for msg in msgs:
                     t = msg.get("type")
@@ -1393,14 +1826,16 @@ def run_module(mod: Module, consume, clear) -> None:
                     elif t == "exit":
                         exit_requested = True
 
-                now = time.time()
-                if (now - last_draw_time) >= 0.08:
+                now = time.monotonic()
+                ui_key = tuple(state.values())
+                if (now - last_draw_time) >= 0.08 and ui_key != last_ui_key:
                     pg = str(state.get("page") or "main")
                     if pg == "fatal":
                         draw_fatal()
                     else:
                         draw_main()
                     last_draw_time = now
+                    last_ui_key = ui_key
 
                 if exit_requested:
                     break
@@ -1416,30 +1851,39 @@ def run_module(mod: Module, consume, clear) -> None:
                         pass
                     break
 
-                time.sleep(0.02)
+                # Sleep until input/output arrives, or a throttled redraw is due.
+                wait_io(last_draw_time + 0.08 - now if ui_key != last_ui_key else 0.25)
 
         # =====================================================
         # Normal modules path (legacy stdin forwarding)
         # =====================================================
         else:
             while proc.poll() is None:
-                if consume("up"):
+                while consume("up"):
                     send("up")
-                if consume("down"):
+                while consume("down"):
                     send("down")
                 if consume("select_hold"):
                     send("select_hold")
                     consume("select")
                 elif consume("select"):
                     send("select")
+                flush_sends()
 
                 if consume("back"):
                     graceful_exit()
                     break
 
-                time.sleep(0.02)
+                wait_io(0.5)
 
     finally:
+        try:
+            io_sel.close()
+            if pidfd is not None:
+                os.close(pidfd)
+        except Exception:
+            pass
+
         # Cleanup pump/stdout
         try:
             if pump:
@@ -1456,14 +1900,11 @@ def run_module(mod: Module, consume, clear) -> None:
 
         # wait a bit; force kill if needed
         try:
-            if proc:
+            if proc and not wait_child(proc, 1.0):
+                proc.kill()
                 proc.wait(timeout=1.0)
         except Exception:
-            try:
-                if proc:
-                    proc.kill()
-            except Exception:
-                pass
+            pass
 
         try:
             if proc:
@@ -1471,11 +1912,7 @@ def run_module(mod: Module, consume, clear) -> None:
         except Exception:
             pass
 
-        if logf:
-            try:
-                logf.close()
-            except Exception:
-                pass
+        close_log()
 
         # Clear and drain AGAIN after return
         clear()
@@ -1496,7 +1933,7 @@ def main() -> None:
             time.sleep(1)
 
     ensure_dirs()
-    consume, clear, buttons = init_buttons()
+    consume, clear, next_event, buttons = init_buttons()
     _, _, _, btn_back = buttons
 
     startup_sequence(consume, clear)
@@ -1511,38 +1948,52 @@ def main() -> None:
     last_menu_draw = 0.0
     back_pressed_at = None
 
-    def redraw_menu() -> None:
+    def redraw_menu(force: bool = False) -> None:
         nonlocal last_menu_draw
-        draw_menu(modules, idx)
-        last_menu_draw = time.time()
+        draw_menu(modules, idx, force)
+        last_menu_draw = time.monotonic()
 
     redraw_menu()
 
     while True:
-        now = time.time()
+        now = time.monotonic()
 
         if now - last_menu_draw >= MENU_REFRESH_SECONDS:
-            redraw_menu()
+            oled_repaint()
+            redraw_menu(force=True)
 
-        if consume("up"):
-            idx = (idx - 1) % len(modules)
-            redraw_menu()
+        # Handle presses in the order they happened. A burst of UP/DOWN
+        # (a fast scroll) moves the cursor and repaints the menu once.
+        moved = False
+        ev = next_event()
+        while ev is not None:
+            if ev == "up":
+                idx = (idx - 1) % len(modules)
+                moved = True
 
-        if consume("down"):
-            idx = (idx + 1) % len(modules)
-            redraw_menu()
+            elif ev == "down":
+                idx = (idx + 1) % len(modules)
+                moved = True
 
-        if consume("select"):
-            clear()
-            drain_events(consume, seconds=0.10)
+            elif ev == "select":
+                clear()
+                drain_events(consume, seconds=0.10)
 
-            if modules[idx].id != "none":
-                run_module(modules[idx], consume, clear)
+                if modules[idx].id != "none":
+                    run_module(modules[idx], consume, clear)
 
-            redraw_menu()
+                redraw_menu(force=True)
+                moved = False
 
-        if consume("select_hold"):
-            settings(consume, clear)
+            elif ev == "select_hold":
+                settings(consume, clear)
+                redraw_menu(force=True)
+                moved = False
+
+            # BACK taps are ignored in the menu; holds are timed below.
+            ev = next_event()
+
+        if moved:
             redraw_menu()
 
         if btn_back.is_pressed:
@@ -1556,21 +2007,22 @@ def main() -> None:
                     poweroff()
                     return
                 back_pressed_at = None
-                redraw_menu()
+                redraw_menu(force=True)
 
             elif held >= BACK_REBOOT_HOLD:
                 if confirm_action("REBOOT?", consume, clear):
                     reboot()
                     return
                 back_pressed_at = None
-                redraw_menu()
+                redraw_menu(force=True)
         else:
             back_pressed_at = None
 
-        # Eat queued BACK events while in menu loop.
-        consume("back")
-
-        time.sleep(0.02)
+        # Block until a button fires; only poll while BACK is being held.
+        if back_pressed_at is not None:
+            wait_for_buttons(0.05)
+        else:
+            wait_for_buttons(MENU_REFRESH_SECONDS - (time.monotonic() - last_menu_draw))
 
 
 if __name__ == "__main__":
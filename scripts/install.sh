@@ -87,6 +87,8 @@ User=$APP_USER
 WorkingDirectory=$INSTALL_DIR
 Environment=PYTHONUNBUFFERED=1
 Environment=GPIOZERO_PIN_FACTORY=lgpio
+# lets module audio threads use SCHED_FIFO (spirit box capture/playback)
+LimitRTPRIO=20
 ExecStart=$VENV_DIR/bin/python $APP_PATH
 Restart=on-failure
 RestartSec=2
@@ -103,6 +105,6 @@ echo "==> Verifying venv interpreter..."
 test -x "$VENV_DIR/bin/python"
 
 echo "==> Verifying imports..."
-"$VENV_DIR/bin/python" -c "import gpiozero, lgpio; import luma.core, luma.oled; import PIL; print('imports OK')"
+"$VENV_DIR/bin/python" -c "import gpiozero, lgpio; import luma.core, luma.oled; import PIL; import numpy; print('imports OK')"
 
 echo "==> Install complete."